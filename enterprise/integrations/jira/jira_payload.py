@@ -6,10 +6,24 @@ Jira webhook payloads, replacing scattered parsing logic throughout the codebase
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from urllib.parse import urlparse
 
+from integrations.utils import has_exact_mention
+
 from openhands.core.logger import openhands_logger as logger
 
+# Names reported for missing fields, in the order they are validated
+_REQUIRED_FIELD_NAMES = (
+    'issue.id',
+    'issue.key',
+    'user.emailAddress',
+    'user.displayName',
+    'user.accountId',
+    'workspace_name (derived from issue.self)',
+    'base_api_url (derived from issue.self)',
+)
+
 
 class JiraEventType(Enum):
     """Types of Jira events we handle."""
@@ -18,7 +32,7 @@ class JiraEventType(Enum):
     COMMENT_MENTION = 'comment_mention'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraWebhookPayload:
     """Normalized, validated representation of a Jira webhook payload.
 
@@ -61,21 +75,21 @@ class JiraPayloadParseError(Exception):
         super().__init__(reason)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraPayloadSuccess:
     """Result when parsing succeeds."""
 
     payload: JiraWebhookPayload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraPayloadSkipped:
     """Result when event is intentionally skipped."""
 
     skip_reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraPayloadError:
     """Result when parsing fails due to invalid data."""
 
@@ -103,6 +117,14 @@ class JiraPayloadParser:
         self.oh_label = oh_label
         self.inline_oh_label = inline_oh_label
 
+        # Skip results are immutable, so reuse one instance per reason
+        self._skip_no_label = JiraPayloadSkipped(
+            f"Label event does not contain '{oh_label}' label"
+        )
+        self._skip_no_mention = JiraPayloadSkipped(
+            f"Comment does not mention '{inline_oh_label}'"
+        )
+
     def parse(self, raw_payload: dict) -> JiraPayloadParseResult:
         """Parse a raw webhook payload into a normalized JiraWebhookPayload.
 
@@ -125,7 +147,10 @@ class JiraPayloadParser:
             return self._parse_label_event(raw_payload, webhook_event)
         elif webhook_event == 'comment_created':
             return self._parse_comment_event(raw_payload, webhook_event)
+        elif isinstance(webhook_event, str):
+            return _skip_unhandled_event(webhook_event)
         else:
+            # Malformed payloads can carry an unhashable webhookEvent
             return JiraPayloadSkipped(f'Unhandled webhook event type: {webhook_event}')
 
     def _parse_label_event(
@@ -135,17 +160,15 @@ class JiraPayloadParser:
         changelog = payload.get('changelog', {})
         items = changelog.get('items', [])
 
-        # Extract labels that were added
-        labels = [
-            item.get('toString', '')
+        # Stop at the first added label that matches, without building a list
+        oh_label = self.oh_label
+        label_added = any(
+            item.get('field') == 'labels' and item.get('toString') == oh_label
             for item in items
-            if item.get('field') == 'labels' and 'toString' in item
-        ]
+        )
 
-        if self.oh_label not in labels:
-            return JiraPayloadSkipped(
-                f"Label event does not contain '{self.oh_label}' label"
-            )
+        if not label_added:
+            return self._skip_no_label
 
         # For label events, user data comes from 'user' field
         user_data = payload.get('user', {})
@@ -165,9 +188,7 @@ class JiraPayloadParser:
         comment_body = comment_data.get('body', '')
 
         if not self._has_mention(comment_body):
-            return JiraPayloadSkipped(
-                f"Comment does not mention '{self.inline_oh_label}'"
-            )
+            return self._skip_no_mention
 
         # For comment events, user data comes from 'comment.author'
         user_data = comment_data.get('author', {})
@@ -181,8 +202,6 @@ class JiraPayloadParser:
 
     def _has_mention(self, text: str) -> bool:
         """Check if text contains an exact mention of OpenHands."""
-        from integrations.utils import has_exact_mention
-
         return has_exact_mention(text, self.inline_oh_label)
 
     def _extract_and_validate(
@@ -202,28 +221,27 @@ class JiraPayloadParser:
         user_email = user_data.get('emailAddress', '')
         display_name = user_data.get('displayName', '')
         account_id = user_data.get('accountId', '')
-        base_api_url, workspace_name = self._extract_workspace_from_url(
-            issue_data.get('self', '')
+        self_url = issue_data.get('self', '')
+        base_api_url, workspace_name = (
+            _split_self_url(self_url) if isinstance(self_url, str) else ('', '')
         )
 
-        # Validate required fields
-        missing: list[str] = []
-        if not issue_id:
-            missing.append('issue.id')
-        if not issue_key:
-            missing.append('issue.key')
-        if not user_email:
-            missing.append('user.emailAddress')
-        if not display_name:
-            missing.append('user.displayName')
-        if not account_id:
-            missing.append('user.accountId')
-        if not workspace_name:
-            missing.append('workspace_name (derived from issue.self)')
-        if not base_api_url:
-            missing.append('base_api_url (derived from issue.self)')
-
-        if missing:
+        # Validate required fields; the missing-names list is only built on failure
+        required = (
+            issue_id,
+            issue_key,
+            user_email,
+            display_name,
+            account_id,
+            workspace_name,
+            base_api_url,
+        )
+        if not all(required):
+            missing = [
+                name
+                for name, value in zip(_REQUIRED_FIELD_NAMES, required)
+                if not value
+            ]
             return JiraPayloadError(f"Missing required fields: {', '.join(missing)}")
 
         return JiraPayloadSuccess(
@@ -241,27 +259,37 @@ class JiraPayloadParser:
             )
         )
 
-    def _extract_workspace_from_url(self, self_url: str) -> tuple[str, str]:
-        """Extract base API URL and workspace name from issue self URL.
 
-        Args:
-            self_url: The 'self' URL from the issue data
+@lru_cache(maxsize=64)
+def _skip_unhandled_event(webhook_event: str) -> JiraPayloadSkipped:
+    """Return a shared skip result for an unhandled webhook event type."""
+    return JiraPayloadSkipped(f'Unhandled webhook event type: {webhook_event}')
 
-        Returns:
-            Tuple of (base_api_url, workspace_name)
-        """
-        if not self_url:
-            return '', ''
 
-        # Extract base URL (everything before /rest/)
-        if '/rest/' in self_url:
-            base_api_url = self_url.split('/rest/')[0]
-        else:
-            parsed = urlparse(self_url)
-            base_api_url = f'{parsed.scheme}://{parsed.netloc}'
+def _split_self_url(self_url: str) -> tuple[str, str]:
+    """Extract base API URL and workspace name from an issue self URL.
+
+    Args:
+        self_url: The 'self' URL from the issue data
+
+    Returns:
+        Tuple of (base_api_url, workspace_name)
+    """
+    if not self_url:
+        return '', ''
+
+    # Extract base URL (everything before /rest/)
+    if '/rest/' in self_url:
+        return _parse_base_api_url(self_url.split('/rest/')[0])
+    parsed = urlparse(self_url)
+    return _parse_base_api_url(f'{parsed.scheme}://{parsed.netloc}')
 
-        # Extract workspace name (hostname)
-        parsed = urlparse(base_api_url)
-        workspace_name = parsed.hostname or ''
 
-        return base_api_url, workspace_name
+@lru_cache(maxsize=512)
+def _parse_base_api_url(base_api_url: str) -> tuple[str, str]:
+    """Pair a base API URL with its workspace name (hostname).
+
+    Every issue in a workspace shares the same base URL, so one cache entry
+    serves the whole workspace.
+    """
+    return base_api_url, urlparse(base_api_url).hostname or ''
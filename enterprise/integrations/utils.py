@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from jinja2 import Environment, FileSystemLoader
@@ -149,13 +150,19 @@ def has_exact_mention(text: str, mention: str) -> bool:
         >>> has_exact_mention("user@openhands.com", "@openhands")  # False
         >>> has_exact_mention("Hello @OpenHands!", "@openhands")  # True (case-insensitive)
     """
-    # Convert both text and mention to lowercase for case-insensitive matching
-    text_lower = text.lower()
-    mention_lower = mention.lower()
+    return _mention_pattern(mention).search(text) is not None
 
-    pattern = re.escape(mention_lower)
+
+@lru_cache(maxsize=32)
+def _mention_pattern(mention: str) -> re.Pattern[str]:
+    """Compile the case-insensitive exact-mention pattern once per mention.
+
+    The pattern is a literal with single-character look-around, so matching
+    stays linear in the length of the text.
+    """
+    pattern = re.escape(mention.lower())
     # Match mention that is not part of a larger word
-    return bool(re.search(rf'(?:^|[^\w@]){pattern}(?![\w-])', text_lower))
+    return re.compile(rf'(?:^|[^\w@]){pattern}(?![\w-])', re.IGNORECASE)
 
 
 def confirm_event_type(event: Event):
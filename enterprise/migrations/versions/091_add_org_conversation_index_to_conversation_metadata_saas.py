@@ -0,0 +1,37 @@
+"""add (org_id, conversation_id) index to conversation_metadata_saas
+
+Revision ID: 091
+Revises: 090
+Create Date: 2025-01-28 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '091'
+down_revision: Union[str, None] = '090'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Covers the org-scoped conversation_id subqueries used when cleaning up
+    # an organization's conversations, so they become a single range scan.
+    op.create_index(
+        'ix_conversation_metadata_saas_org_conversation',
+        'conversation_metadata_saas',
+        ['org_id', 'conversation_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_conversation_metadata_saas_org_conversation',
+        table_name='conversation_metadata_saas',
+    )
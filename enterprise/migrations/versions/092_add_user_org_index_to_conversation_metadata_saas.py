@@ -0,0 +1,39 @@
+"""add (user_id, org_id) covering index to conversation_metadata_saas
+
+Revision ID: 092
+Revises: 091
+Create Date: 2025-01-28 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '092'
+down_revision: Union[str, None] = '091'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Conversation lookups always filter on user_id and usually on org_id.
+    # Including conversation_id lets the join to conversation_metadata be
+    # driven from an index-only scan.
+    op.create_index(
+        'ix_conversation_metadata_saas_user_org',
+        'conversation_metadata_saas',
+        ['user_id', 'org_id'],
+        unique=False,
+        postgresql_include=['conversation_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_conversation_metadata_saas_user_org',
+        table_name='conversation_metadata_saas',
+    )
@@ -7,6 +7,8 @@ from fastapi import Depends, HTTPException, Request, status
 from openhands.core.logger import openhands_logger as logger
 from openhands.server.user_auth import get_user_auth, get_user_id
 
+ADMIN_EMAIL_DOMAINS = frozenset({'openhands.dev'})
+
 
 async def get_admin_user_id(
     request: Request, user_id: str | None = Depends(get_user_id)
@@ -55,10 +57,11 @@ async def get_admin_user_id(
             detail='User email not available',
         )
 
-    if not user_email.endswith('@openhands.dev'):
+    _, at, email_domain = user_email.rpartition('@')
+    if not at or email_domain not in ADMIN_EMAIL_DOMAINS:
         logger.warning(
             'Access denied - invalid email domain',
-            extra={'user_id': user_id, 'email_domain': user_email.split('@')[-1]},
+            extra={'user_id': user_id, 'email_domain': email_domain},
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -294,7 +294,8 @@ async def jira_events(
 
         signature = parts[1]
         body = await request.body()
-        payload = await request.json()
+        # Decode the raw body we already need for signature verification
+        payload = json.loads(body)
 
         await verify_jira_signature(body, signature, payload)
 
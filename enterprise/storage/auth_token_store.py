@@ -81,7 +81,8 @@ class AuthTokenStore:
         to be refreshed and to refresh the tokens if needed.
 
         The method ensures that only one refresh operation is performed per refresh token by using a
-        row-level lock on the token record.
+        row-level lock on the token record. The lock is only taken when `check_expiration_and_refresh`
+        is provided, since reads without it never refresh.
 
         The method is designed to handle race conditions where multiple requests might attempt to refresh
         the same token simultaneously, ensuring that only one refresh call occurs per refresh token.
@@ -103,14 +104,15 @@ class AuthTokenStore:
                 # If it turns out the loaded tokens are expired, then there will be multiple
                 # refresh token calls with the same refresh token. Most IDPs only allow one refresh
                 # per refresh token. This lock ensure that only one refresh call occurs per refresh token
-                result = await session.execute(
-                    select(AuthTokens)
-                    .filter(
-                        AuthTokens.keycloak_user_id == self.keycloak_user_id,
-                        AuthTokens.identity_provider == self.identity_provider_value,
-                    )
-                    .with_for_update()
+                # Plain reads never refresh, so they skip the lock rather than waiting
+                # behind a refresh that is in progress.
+                query = select(AuthTokens).filter(
+                    AuthTokens.keycloak_user_id == self.keycloak_user_id,
+                    AuthTokens.identity_provider == self.identity_provider_value,
                 )
+                if check_expiration_and_refresh:
+                    query = query.with_for_update()
+                result = await session.execute(query)
                 token_record = result.scalars().one_or_none()
 
                 if not token_record:
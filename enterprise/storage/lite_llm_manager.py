@@ -20,6 +20,12 @@ from server.constants import (
 from server.logger import logger
 from storage.encrypt_utils import decrypt_legacy_value
 from storage.user_settings import UserSettings
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from openhands.server.settings import Settings
 from openhands.utils.http_session import httpx_verify_option
@@ -30,6 +36,11 @@ BYOR_KEY_VERIFICATION_TIMEOUT = 5.0
 # A very large number to represent "unlimited" until LiteLLM fixes their unlimited update bug.
 UNLIMITED_BUDGET_SETTING = 1000000000.0
 
+# Idempotent LiteLLM reads are retried only when the connection could not be
+# established, with a short backoff. Read timeouts are not retried so a hung
+# upstream still fails fast
+LITE_LLM_READ_RETRY_ATTEMPTS = 3
+
 
 class LiteLlmManager:
     """Manage LiteLLM interactions."""
@@ -485,6 +496,12 @@ class LiteLlmManager:
         response.raise_for_status()
 
     @staticmethod
+    @retry(
+        stop=stop_after_attempt(LITE_LLM_READ_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=0.25, max=2),
+        retry=retry_if_exception_type((httpx.ConnectError, httpx.ConnectTimeout)),
+        reraise=True,
+    )
     async def _get_team(client: httpx.AsyncClient, team_id: str) -> dict | None:
         if LITE_LLM_API_KEY is None or LITE_LLM_API_URL is None:
             logger.warning('LiteLLM API configuration not found')
@@ -408,58 +408,77 @@ class OrgService:
         Returns:
             bool: True if user has admin or owner role, False otherwise
         """
-        try:
-            # Parse user_id as UUID for database query
-            user_uuid = parse_uuid(user_id)
+        org_member = OrgService._get_org_member(user_id, org_id)
+        return org_member is not None and OrgService._member_has_admin_or_owner_role(
+            org_member
+        )
 
-            # Get the user's membership in this organization
-            # Note: The type annotation says int but the actual column is UUID
-            org_member = OrgMemberStore.get_org_member(org_id, user_uuid)
-            if not org_member:
-                return False
+    @staticmethod
+    def is_org_member(user_id: str, org_id: UUID) -> bool:
+        """
+        Check if user is a member of the specified organization.
 
-            # Get the role details
-            role = RoleStore.get_role_by_id(org_member.role_id)
-            if not role:
-                return False
+        Args:
+            user_id: User ID to check
+            org_id: Organization ID to check membership in
 
-            # Admin and owner roles have elevated permissions
-            # Based on test files, both admin and owner have rank 1
-            return role.name in ['admin', 'owner']
+        Returns:
+            bool: True if user is a member, False otherwise
+        """
+        return OrgService._get_org_member(user_id, org_id) is not None
 
+    @staticmethod
+    def _get_org_member(user_id: str, org_id: UUID) -> OrgMember | None:
+        """
+        Get the user's membership in the specified organization.
+
+        Args:
+            user_id: User ID to look up
+            org_id: Organization ID to look up membership in
+
+        Returns:
+            OrgMember | None: The membership, or None if not a member or lookup fails
+        """
+        try:
+            user_uuid = parse_uuid(user_id)
+            return OrgMemberStore.get_org_member(org_id, user_uuid)
         except Exception as e:
             logger.warning(
-                'Error checking user role in organization',
+                'Error checking user membership in organization',
                 extra={
                     'user_id': user_id,
                     'org_id': str(org_id),
                     'error': str(e),
                 },
             )
-            return False
+            return None
 
     @staticmethod
-    def is_org_member(user_id: str, org_id: UUID) -> bool:
+    def _member_has_admin_or_owner_role(org_member: OrgMember) -> bool:
         """
-        Check if user is a member of the specified organization.
+        Check if an organization membership has admin or owner role.
 
         Args:
-            user_id: User ID to check
-            org_id: Organization ID to check membership in
+            org_member: Membership to check
 
         Returns:
-            bool: True if user is a member, False otherwise
+            bool: True if the member's role is admin or owner, False otherwise
         """
         try:
-            user_uuid = parse_uuid(user_id)
-            org_member = OrgMemberStore.get_org_member(org_id, user_uuid)
-            return org_member is not None
+            role = RoleStore.get_role_by_id(org_member.role_id)
+            if not role:
+                return False
+
+            # Admin and owner roles have elevated permissions
+            # Based on test files, both admin and owner have rank 1
+            return role.name in ['admin', 'owner']
+
         except Exception as e:
             logger.warning(
-                'Error checking user membership in organization',
+                'Error checking user role in organization',
                 extra={
-                    'user_id': user_id,
-                    'org_id': str(org_id),
+                    'user_id': str(org_member.user_id),
+                    'org_id': str(org_member.org_id),
                     'error': str(e),
                 },
             )
@@ -537,8 +556,10 @@ class OrgService:
         if not existing_org:
             raise ValueError(f'Organization with ID {org_id} not found')
 
-        # Check if user is a member of this organization
-        if not OrgService.is_org_member(user_id, org_id):
+        # Check if user is a member of this organization. The membership is
+        # kept so the LLM settings role check below does not look it up again.
+        org_member = OrgService._get_org_member(user_id, org_id)
+        if org_member is None:
             logger.warning(
                 'Non-member attempted to update organization',
                 extra={
@@ -554,7 +575,7 @@ class OrgService:
         llm_fields_being_updated = OrgService._has_llm_settings_updates(update_data)
         if llm_fields_being_updated:
             # Verify user has admin or owner role
-            has_permission = OrgService.has_admin_or_owner_role(user_id, org_id)
+            has_permission = OrgService._member_has_admin_or_owner_role(org_member)
             if not has_permission:
                 logger.warning(
                     'User attempted to update LLM settings without permission',
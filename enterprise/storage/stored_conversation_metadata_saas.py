@@ -6,7 +6,7 @@ containing only the conversation_id, user_id, and org_id.
 """
 
 from sqlalchemy import UUID as SQL_UUID
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 from storage.base import Base
 
@@ -24,5 +24,20 @@ class StoredConversationMetadataSaas(Base):  # type: ignore
     user = relationship('User', back_populates='stored_conversation_metadata_saas')
     org = relationship('Org', back_populates='stored_conversation_metadata_saas')
 
+    # Covering indexes for org-scoped and user-scoped conversation_id lookups
+    __table_args__ = (
+        Index(
+            'ix_conversation_metadata_saas_org_conversation',
+            'org_id',
+            'conversation_id',
+        ),
+        Index(
+            'ix_conversation_metadata_saas_user_org',
+            'user_id',
+            'org_id',
+            postgresql_include=['conversation_id'],
+        ),
+    )
+
 
 __all__ = ['StoredConversationMetadataSaas']
@@ -6,6 +6,7 @@ import pytest
 from server.constants import ORG_SETTINGS_VERSION
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from storage.base import Base
 
 # Anything not loaded here may not have a table created for it.
@@ -28,7 +29,11 @@ from storage.user import User
 
 @pytest.fixture
 def engine():
-    engine = create_engine('sqlite:///:memory:')
+    engine = create_engine(
+        'sqlite:///:memory:',
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False},
+    )
     Base.metadata.create_all(engine)
     return engine
 
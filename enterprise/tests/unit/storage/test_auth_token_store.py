@@ -0,0 +1,114 @@
+"""
+Unit tests for AuthTokenStore.load_tokens.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from storage.auth_token_store import AuthTokenStore
+from storage.auth_tokens import AuthTokens
+from storage.base import Base
+
+from openhands.integrations.service_types import ProviderType
+
+
+@pytest.fixture
+async def async_engine():
+    """Create an async SQLite engine for testing."""
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///:memory:',
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False},
+        echo=False,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_session_maker(async_engine):
+    """Create an async session maker for testing."""
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def token_store(async_session_maker):
+    """Create an AuthTokenStore with a stored token record."""
+    async with async_session_maker() as session:
+        session.add(
+            AuthTokens(
+                keycloak_user_id='user-1',
+                identity_provider=ProviderType.GITHUB.value,
+                access_token='old-access',
+                refresh_token='old-refresh',
+                access_token_expires_at=100,
+                refresh_token_expires_at=200,
+            )
+        )
+        await session.commit()
+
+    return AuthTokenStore(
+        keycloak_user_id='user-1',
+        idp=ProviderType.GITHUB,
+        a_session_maker=async_session_maker,
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_tokens_without_refresh_does_not_lock(token_store):
+    """Test a plain read returns the stored tokens without SELECT ... FOR UPDATE."""
+    with patch.object(
+        AsyncSession, 'execute', autospec=True, side_effect=AsyncSession.execute
+    ) as mock_execute:
+        tokens = await token_store.load_tokens()
+
+    assert tokens == {
+        'access_token': 'old-access',
+        'refresh_token': 'old-refresh',
+        'access_token_expires_at': 100,
+        'refresh_token_expires_at': 200,
+    }
+    assert [call.args[1]._for_update_arg for call in mock_execute.mock_calls] == [None]
+
+
+@pytest.mark.asyncio
+async def test_load_tokens_with_refresh_locks_and_persists(token_store):
+    """Test a refreshing read locks the row and stores the refreshed tokens."""
+    refreshed = {
+        'access_token': 'new-access',
+        'refresh_token': 'new-refresh',
+        'access_token_expires_at': 300,
+        'refresh_token_expires_at': 400,
+    }
+    check_expiration_and_refresh = AsyncMock(return_value=refreshed)
+
+    with patch.object(
+        AsyncSession, 'execute', autospec=True, side_effect=AsyncSession.execute
+    ) as mock_execute:
+        tokens = await token_store.load_tokens(check_expiration_and_refresh)
+
+    assert tokens == refreshed
+    check_expiration_and_refresh.assert_awaited_once_with(
+        ProviderType.GITHUB, 'old-refresh', 100, 200
+    )
+    assert mock_execute.mock_calls[0].args[1]._for_update_arg is not None
+    assert await token_store.load_tokens() == refreshed
+
+
+@pytest.mark.asyncio
+async def test_load_tokens_no_record(async_session_maker):
+    """Test None is returned when the user has no stored tokens."""
+    store = AuthTokenStore(
+        keycloak_user_id='missing-user',
+        idp=ProviderType.GITHUB,
+        a_session_maker=async_session_maker,
+    )
+
+    assert await store.load_tokens() is None
@@ -5,6 +5,7 @@ Tests the persistent identity storage for the OpenHands Enterprise Telemetry Ser
 
 from datetime import datetime
 
+import pytest
 from storage.telemetry_identity import TelemetryIdentity
 
 
@@ -71,26 +72,22 @@ class TestTelemetryIdentity:
         assert identity.customer_id == 'existing_customer'
         assert identity.instance_id == 'existing_instance'
 
-    def test_has_customer_info_property(self):
-        """Test has_customer_info property logic."""
+    @pytest.mark.parametrize(
+        'customer_id,instance_id,expected',
+        [
+            (None, None, False),
+            ('customer_123', None, False),
+            (None, 'instance_456', False),
+            ('customer_123', 'instance_456', True),
+        ],
+    )
+    def test_has_customer_info_property(self, customer_id, instance_id, expected):
+        """Test has_customer_info is only true when both identifiers are set."""
         identity = TelemetryIdentity()
+        identity.customer_id = customer_id
+        identity.instance_id = instance_id
 
-        # Initially false (both None)
-        assert not identity.has_customer_info
-
-        # Still false with only customer_id
-        identity.customer_id = 'customer_123'
-        assert not identity.has_customer_info
-
-        # Still false with only instance_id
-        identity.customer_id = None
-        identity.instance_id = 'instance_456'
-        assert not identity.has_customer_info
-
-        # True when both are set
-        identity.customer_id = 'customer_123'
-        identity.instance_id = 'instance_456'
-        assert identity.has_customer_info
+        assert identity.has_customer_info is expected
 
     def test_has_customer_info_with_empty_strings(self):
         """Test has_customer_info with empty strings."""
@@ -182,6 +182,27 @@ async def test_get_openhands_user_id_similar_domain_not_allowed(
         assert exc_info.value.status_code == 403
 
 
+@pytest.mark.asyncio
+async def test_get_openhands_user_id_bare_domain_not_allowed(
+    mock_request, mock_user_auth
+):
+    """
+    GIVEN: Email value that is just the domain, without an @
+    WHEN: get_admin_user_id is called
+    THEN: 403 Forbidden is raised
+    """
+    # Arrange
+    user_id = 'test-user-123'
+    mock_user_auth.get_user_email.return_value = 'openhands.dev'
+
+    with patch('server.email_validation.get_user_auth', return_value=mock_user_auth):
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_admin_user_id(mock_request, user_id)
+
+        assert exc_info.value.status_code == 403
+
+
 @pytest.mark.asyncio
 async def test_get_openhands_user_id_logs_warning_on_invalid_domain(
     mock_request, mock_user_auth
@@ -13,6 +13,7 @@ from server.constants import (
 )
 from storage.lite_llm_manager import LiteLlmManager
 from storage.user_settings import UserSettings
+from tenacity import wait_none
 
 from openhands.server.settings import Settings
 
@@ -533,6 +534,54 @@ class TestLiteLlmManager:
                     'http://test.com/team/info?team_id=test-team-id'
                 )
 
+    @pytest.mark.asyncio
+    async def test_get_team_retries_transport_error(
+        self, mock_http_client, mock_team_response
+    ):
+        """Test _get_team retries a connection failure before succeeding."""
+        mock_http_client.get.side_effect = [
+            httpx.ConnectError('Connection refused'),
+            mock_team_response,
+        ]
+
+        with patch('storage.lite_llm_manager.LITE_LLM_API_KEY', 'test-key'):
+            with patch('storage.lite_llm_manager.LITE_LLM_API_URL', 'http://test.com'):
+                with patch.object(LiteLlmManager._get_team.retry, 'wait', wait_none()):
+                    result = await LiteLlmManager._get_team(
+                        mock_http_client, 'test-team-id'
+                    )
+
+                assert result is not None
+                assert mock_http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_team_read_timeout_not_retried(self, mock_http_client):
+        """Test _get_team does not retry a read timeout from a hung upstream."""
+        mock_http_client.get.side_effect = httpx.ReadTimeout('Read timed out')
+
+        with patch('storage.lite_llm_manager.LITE_LLM_API_KEY', 'test-key'):
+            with patch('storage.lite_llm_manager.LITE_LLM_API_URL', 'http://test.com'):
+                with pytest.raises(httpx.ReadTimeout):
+                    await LiteLlmManager._get_team(mock_http_client, 'test-team-id')
+
+                mock_http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_team_http_error_not_retried(self, mock_http_client):
+        """Test _get_team does not retry an HTTP error response."""
+        error_response = MagicMock()
+        error_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            'Not found', request=MagicMock(), response=error_response
+        )
+        mock_http_client.get.return_value = error_response
+
+        with patch('storage.lite_llm_manager.LITE_LLM_API_KEY', 'test-key'):
+            with patch('storage.lite_llm_manager.LITE_LLM_API_URL', 'http://test.com'):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await LiteLlmManager._get_team(mock_http_client, 'test-team-id')
+
+                mock_http_client.get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_create_user_success(self, mock_http_client, mock_response):
         """Test successful _create_user operation."""
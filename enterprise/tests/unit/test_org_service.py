@@ -1160,6 +1160,68 @@ async def test_update_org_with_permissions_success_llm_fields_admin(session_make
         assert result.default_llm_base_url == 'https://api.anthropic.com'
 
 
+@pytest.mark.asyncio
+async def test_update_org_with_permissions_llm_fields_single_member_lookup(
+    session_maker,
+):
+    """
+    GIVEN: Organization update with LLM fields and user has admin role
+    WHEN: update_org_with_permissions is called
+    THEN: The membership is looked up once for both the member and role checks
+    """
+    # Arrange
+    org_id = uuid.uuid4()
+    user_id = str(uuid.uuid4())
+
+    with session_maker() as session:
+        org = Org(
+            id=org_id,
+            name='Test Organization',
+            contact_name='John Doe',
+            contact_email='john@example.com',
+            org_version=5,
+        )
+        session.add(org)
+        user = User(id=uuid.UUID(user_id), current_org_id=org_id)
+        session.add(user)
+        admin_role = Role(id=1, name='admin', rank=1)
+        session.add(admin_role)
+        org_member = OrgMember(
+            org_id=org_id,
+            user_id=uuid.UUID(user_id),
+            role_id=1,
+            status='active',
+            _llm_api_key='test-key',
+        )
+        session.add(org_member)
+        session.commit()
+
+    from server.routes.org_models import OrgUpdate
+    from storage.org_member_store import OrgMemberStore
+
+    update_data = OrgUpdate(default_llm_model='claude-opus-4-5-20251101')
+
+    with (
+        patch('storage.org_store.session_maker', session_maker),
+        patch('storage.org_member_store.session_maker', session_maker),
+        patch('storage.role_store.session_maker', session_maker),
+        patch(
+            'storage.org_service.OrgMemberStore.get_org_member',
+            wraps=OrgMemberStore.get_org_member,
+        ) as mock_get_org_member,
+    ):
+        # Act
+        result = await OrgService.update_org_with_permissions(
+            org_id=org_id,
+            update_data=update_data,
+            user_id=user_id,
+        )
+
+        # Assert
+        assert result.default_llm_model == 'claude-opus-4-5-20251101'
+        mock_get_org_member.assert_called_once_with(org_id, uuid.UUID(user_id))
+
+
 @pytest.mark.asyncio
 async def test_update_org_with_permissions_success_llm_fields_owner(session_maker):
     """
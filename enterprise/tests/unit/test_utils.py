@@ -32,6 +32,19 @@ def test_has_exact_mention():
     assert has_exact_mention('Hi @OpenHands', '@openhands') is True
     assert has_exact_mention('Hi @openhands', '@OpenHands') is True
     assert has_exact_mention('Hi @OPENHANDS', '@openhands') is True
+    assert has_exact_mention('Hi @OpenHands', '@OPENHANDS') is True
+    assert has_exact_mention('Hey @oPeNhAnDs, please help', '@OpenHands') is True
+    assert has_exact_mention('Hi @OpenHands-Exp', '@openhands-exp') is True
+    assert has_exact_mention('@OpenHands-Exp', '@openhands') is False
+
+    # Test non-ASCII text around the mention
+    assert has_exact_mention('Merci @OPENHANDS, ça marche', '@openhands') is True
+    assert has_exact_mention('日本語 @OpenHands です', '@openhands') is True
+    assert has_exact_mention('«@OpenHands»', '@openhands') is True
+    assert has_exact_mention('ÉCOLE @openhands', '@OpenHands') is True
+    assert has_exact_mention('café@openhands', '@openhands') is False
+    assert has_exact_mention('Grüße@OpenHands', '@openhands') is False
+    assert has_exact_mention('@openhandsé', '@openhands') is False
 
     # Test multiple mentions
     assert has_exact_mention('@openhands and @openhands again', '@openhands') is True
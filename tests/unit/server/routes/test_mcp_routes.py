@@ -1,4 +1,5 @@
 import warnings
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -47,9 +48,10 @@ async def test_get_conversation_link_non_saas_mode():
     mock_service = AsyncMock(spec=GitService)
 
     # Test with non-SAAS mode
-    with patch('openhands.server.routes.mcp.server_config') as mock_config:
-        mock_config.app_mode = AppMode.OPENHANDS
-
+    with patch(
+        'openhands.server.routes.mcp.server_config',
+        SimpleNamespace(app_mode=AppMode.OPENHANDS),
+    ):
         # Call the function
         result = await get_conversation_link(
             service=mock_service, conversation_id='test-convo-id', body='Original body'
@@ -66,20 +68,20 @@ async def test_get_conversation_link_saas_mode():
     """Test get_conversation_link in SAAS mode."""
     # Mock GitService and user
     mock_service = AsyncMock(spec=GitService)
-    mock_user = AsyncMock()
-    mock_user.login = 'testuser'
+    mock_user = SimpleNamespace(login='testuser')
     mock_service.get_user.return_value = mock_user
 
     # Test with SAAS mode
     with (
-        patch('openhands.server.routes.mcp.server_config') as mock_config,
+        patch(
+            'openhands.server.routes.mcp.server_config',
+            SimpleNamespace(app_mode=AppMode.SAAS),
+        ),
         patch(
             'openhands.server.routes.mcp.CONVERSATION_URL',
             'https://test.example.com/conversations/{}',
         ),
     ):
-        mock_config.app_mode = AppMode.SAAS
-
         # Call the function
         result = await get_conversation_link(
             service=mock_service, conversation_id='test-convo-id', body='Original body'
@@ -98,20 +100,20 @@ async def test_get_conversation_link_empty_body():
     """Test get_conversation_link with an empty body."""
     # Mock GitService and user
     mock_service = AsyncMock(spec=GitService)
-    mock_user = AsyncMock()
-    mock_user.login = 'testuser'
+    mock_user = SimpleNamespace(login='testuser')
     mock_service.get_user.return_value = mock_user
 
     # Test with SAAS mode and empty body
     with (
-        patch('openhands.server.routes.mcp.server_config') as mock_config,
+        patch(
+            'openhands.server.routes.mcp.server_config',
+            SimpleNamespace(app_mode=AppMode.SAAS),
+        ),
         patch(
             'openhands.server.routes.mcp.CONVERSATION_URL',
             'https://test.example.com/conversations/{}',
         ),
     ):
-        mock_config.app_mode = AppMode.SAAS
-
         # Call the function
         result = await get_conversation_link(
             service=mock_service, conversation_id='test-convo-id', body=''